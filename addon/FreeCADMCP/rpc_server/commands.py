@@ -2,7 +2,9 @@
 
 Defines the five toolbar/menu entries (Start, Stop, Toggle Auto-Start,
 Toggle Remote, Configure Allowed IPs), plus the post-startup sync that
-reflects saved settings on the checkable items.
+reflects saved settings on the checkable items. FreeCAD polls
+``GetResources`` whenever it rebuilds menus and toolbars, so each command
+returns a prebuilt class-level dict.
 
 ``register_commands()`` and ``schedule_toggle_sync()`` are invoked from
 ``rpc_server.py`` at import time to preserve current side-effect behavior.
@@ -17,8 +19,10 @@ from rpc_server.settings import load_settings, save_settings
 
 
 class StartRPCServerCommand:
+    _RESOURCES = {"MenuText": "Start RPC Server", "ToolTip": "Start RPC Server"}
+
     def GetResources(self):
-        return {"MenuText": "Start RPC Server", "ToolTip": "Start RPC Server"}
+        return self._RESOURCES
 
     def Activated(self):
         from . import rpc_server  # late import: avoids circular at module load
@@ -30,8 +34,10 @@ class StartRPCServerCommand:
 
 
 class StopRPCServerCommand:
+    _RESOURCES = {"MenuText": "Stop RPC Server", "ToolTip": "Stop RPC Server"}
+
     def GetResources(self):
-        return {"MenuText": "Stop RPC Server", "ToolTip": "Stop RPC Server"}
+        return self._RESOURCES
 
     def Activated(self):
         from . import rpc_server
@@ -43,12 +49,14 @@ class StopRPCServerCommand:
 
 
 class ToggleRemoteConnectionsCommand:
+    _RESOURCES = {
+        "MenuText": "Remote Connections",
+        "ToolTip": "Enable or disable remote connections for the RPC server.",
+        "Checkable": True,
+    }
+
     def GetResources(self):
-        return {
-            "MenuText": "Remote Connections",
-            "ToolTip": "Enable or disable remote connections for the RPC server.",
-            "Checkable": True,
-        }
+        return self._RESOURCES
 
     def Activated(self, checked=0):
         from . import rpc_server
@@ -74,11 +82,13 @@ class ToggleRemoteConnectionsCommand:
 
 
 class ConfigureAllowedIPsCommand:
+    _RESOURCES = {
+        "MenuText": "Configure Allowed IPs",
+        "ToolTip": "Set which IP addresses or subnets are allowed to connect to the RPC server.",
+    }
+
     def GetResources(self):
-        return {
-            "MenuText": "Configure Allowed IPs",
-            "ToolTip": "Set which IP addresses or subnets are allowed to connect to the RPC server.",
-        }
+        return self._RESOURCES
 
     def Activated(self):
         from . import rpc_server
@@ -124,12 +134,14 @@ class ConfigureAllowedIPsCommand:
 
 
 class ToggleAutoStartCommand:
+    _RESOURCES = {
+        "MenuText": "Auto-Start Server",
+        "ToolTip": "Automatically start the RPC server when FreeCAD launches.",
+        "Checkable": True,
+    }
+
     def GetResources(self):
-        return {
-            "MenuText": "Auto-Start Server",
-            "ToolTip": "Automatically start the RPC server when FreeCAD launches.",
-            "Checkable": True,
-        }
+        return self._RESOURCES
 
     def Activated(self, checked=0):
         settings = load_settings()
@@ -163,31 +175,50 @@ _TOGGLE_COMMANDS = {
     "Toggle_Remote_Connections": "remote_enabled",
     "Toggle_Auto_Start": "auto_start_rpc",
 }
-_SYNC_MAX_RETRIES = 10  # ~20 s at 2 s/retry before giving up
+_SYNC_FIRST_DELAY_MS = 50
+_SYNC_MAX_DELAY_MS = 2000
+_SYNC_MAX_RETRIES = 15  # ~20 s in total before giving up
 
 
-def _sync_toggle_states(retries_left: int = _SYNC_MAX_RETRIES) -> None:
+def _sync_toggle_states(
+    retries_left: int = _SYNC_MAX_RETRIES,
+    delay_ms: int = _SYNC_FIRST_DELAY_MS,
+    pending: dict[str, str] | None = None,
+) -> None:
     """Sync checkable menu items with saved settings on startup.
 
     The menu actions are created asynchronously, so retry a bounded number of
-    times until they exist rather than polling forever.
+    times until they exist rather than polling forever. The retry delay
+    doubles from ``_SYNC_FIRST_DELAY_MS`` up to ``_SYNC_MAX_DELAY_MS``, so a
+    GUI that is ready early is synced early. ``pending`` carries the
+    commands not synced yet, so a retry only searches for those.
     """
+    if pending is None:
+        pending = dict(_TOGGLE_COMMANDS)
     try:
         settings = load_settings()
         main_window = FreeCADGui.getMainWindow()
-        found = 0
-        for action in main_window.findChildren(QtWidgets.QAction):
-            key = _TOGGLE_COMMANDS.get(action.objectName())
-            if key is not None:
-                action.setChecked(bool(settings.get(key, False)))
-                found += 1
-        if found == len(_TOGGLE_COMMANDS):
+        # FreeCAD names each command's QAction after the command, so look
+        # the two up directly instead of walking every action in the app.
+        for name, key in list(pending.items()):
+            action = main_window.findChild(QtWidgets.QAction, name)
+            if action is not None:
+                checked = bool(settings.get(key, False))
+                # Only touch the action when it differs: setChecked emits
+                # change signals and repaints menus/toolbars even for no-ops.
+                if action.isChecked() != checked:
+                    action.setChecked(checked)
+                del pending[name]
+        if not pending:
             return
     except Exception:
         pass
     if retries_left > 0:
-        QtCore.QTimer.singleShot(2000, lambda: _sync_toggle_states(retries_left - 1))
+        next_delay = min(delay_ms * 2, _SYNC_MAX_DELAY_MS)
+        QtCore.QTimer.singleShot(
+            delay_ms, lambda: _sync_toggle_states(retries_left - 1, next_delay, pending)
+        )
 
 
 def schedule_toggle_sync() -> None:
-    QtCore.QTimer.singleShot(2000, _sync_toggle_states)
+    QtCore.QTimer.singleShot(_SYNC_FIRST_DELAY_MS, _sync_toggle_states)
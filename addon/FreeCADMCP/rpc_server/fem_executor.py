@@ -4,7 +4,9 @@ import tempfile
 import traceback
 
 import FreeCAD
-import ObjectsFem
+
+
+_MISSING = object()
 
 
 def run_fem_analysis(doc_name: str, analysis_name: str) -> dict:
@@ -32,6 +34,8 @@ def run_fem_analysis(doc_name: str, analysis_name: str) -> dict:
                 solver = member
                 break
         if solver is None:
+            import ObjectsFem
+
             solver_factory = (
                 getattr(ObjectsFem, "makeSolverCalculiXCcxTools", None)
                 or getattr(ObjectsFem, "makeSolverCalculixCcxTools", None)
@@ -58,16 +62,21 @@ def run_fem_analysis(doc_name: str, analysis_name: str) -> dict:
         fea.run()
         fea.load_results()
 
+        # Probe vonMises with getattr and keep the value: hasattr would convert
+        # the whole per-node list only to throw it away and read it again.
         result_obj = None
+        vm = None
         for member in analysis.Group:
-            if "Result" in getattr(member, "TypeId", "") and hasattr(member, "vonMises"):
-                result_obj = member
-                break
+            if "Result" in getattr(member, "TypeId", ""):
+                values = getattr(member, "vonMises", _MISSING)
+                if values is not _MISSING:
+                    result_obj, vm = member, values
+                    break
         if result_obj is None:
             return {"success": False, "error": "Solver ran but no result object was produced.", "working_dir": work_dir}
 
         # vonMises / DisplacementLengths can be None on a degenerate run.
-        vm = list(getattr(result_obj, "vonMises", None) or [])
+        vm = list(vm or [])
         disp = list(getattr(result_obj, "DisplacementLengths", None) or [])
         doc.recompute()
 
@@ -7,15 +7,18 @@ RPC handlers use to invoke them.
 
 Robustness and performance guarantees:
 
-1. Per-call response queues: each ``dispatch_to_gui`` call owns its own
-   ``queue.Queue``. A timeout in one call can never corrupt the response for
-   a subsequent call.
+1. Per-call result slots: each ``dispatch_to_gui`` call owns a
+   ``_PendingCall`` (an ``Event`` plus a result slot). A timeout in one call
+   can never corrupt the response for a subsequent call.
 2. Immediate wake via Qt signal: ``dispatch_to_gui`` emits a signal from the
    RPC thread; the GUI thread processes the task immediately rather than
-   waiting for the next 500 ms heartbeat tick. The 500 ms heartbeat is kept
-   only as a fallback.
+   waiting for the next heartbeat tick. The ``HEARTBEAT_MS`` heartbeat is
+   kept only as a fallback.
 3. Mouse-button guard: ``process_gui_tasks`` skips the current tick while
    mouse buttons are held so MCP tasks cannot interrupt 3D navigation drags.
+   A deferred wake retries every ``_DEFER_RETRY_MS`` until it runs, so the
+   task does not sit waiting for the slow heartbeat. A single tick runs at
+   most ``_MAX_TASKS_PER_TICK`` tasks before yielding to the event loop.
 4. Clean shutdown: the ``_SHUTDOWN`` sentinel sets a flag that suppresses the
    ``finally`` reschedule, so ``stop_rpc_server`` actually stops the loop.
 5. Exception isolation: exceptions inside a task are caught, logged, and
@@ -23,6 +26,7 @@ Robustness and performance guarantees:
 """
 
 import queue
+import threading
 import time
 import traceback
 from typing import Any, Callable
@@ -36,6 +40,11 @@ _rpc_request_queue: "queue.Queue[Any]" = queue.Queue()
 _SHUTDOWN = object()
 _processing = False  # re-entrancy guard: True while process_gui_tasks is draining
 _processing_since: float = 0.0  # wall-clock time when _processing became True
+_retry_scheduled = False  # True while a deferred-wake retry timer is pending
+
+HEARTBEAT_MS = 2000  # fallback tick; normal dispatch wakes the GUI thread directly
+_DEFER_RETRY_MS = 50
+_MAX_TASKS_PER_TICK = 64  # yield to the event loop between bursts of tasks
 
 
 class _WakeSignal(QtCore.QObject):
@@ -44,20 +53,69 @@ class _WakeSignal(QtCore.QObject):
     Must be created on the GUI thread (``init_waker``). Emitting from the
     RPC thread is safe: Qt delivers the connection with ``QueuedConnection``,
     so the slot always fires in the GUI thread's event loop.
+
+    While a wake is already queued, further ``wake`` calls are no-ops: the
+    pending slot drains every task enqueued before it runs, so a burst of
+    RPC calls posts one event instead of one per call.
     """
     _sig = QtCore.Signal()
 
     def __init__(self):
         super().__init__()
+        self._pending = False
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            self.moveToThread(app.thread())
         self._sig.connect(self._on_wake, QtCore.Qt.QueuedConnection)
 
     def wake(self) -> None:
+        if self._pending:
+            return
+        self._pending = True
         self._sig.emit()
 
     def _on_wake(self) -> None:
+        # Clear before draining so a task enqueued mid-drain emits a fresh wake.
+        self._pending = False
         process_gui_tasks(reschedule=False)
 
 
+class _PendingCall:
+    """Result slot for one ``dispatch_to_gui`` call, filled on the GUI thread."""
+    __slots__ = ("task", "result", "done")
+
+    def __init__(self, task: Callable[[], Any]):
+        self.task = task
+        self.result: Any = None
+        self.done = threading.Event()
+
+    def __call__(self) -> None:
+        try:
+            self.result = self.task()
+        except Exception as e:
+            FreeCAD.Console.PrintError(
+                f"MCP RPC: GUI task raised {type(e).__name__}: {e}\n"
+                f"{traceback.format_exc()}"
+            )
+            self.result = f"{type(e).__name__}: {e}"
+        self.done.set()
+
+
+def _retry_deferred() -> None:
+    global _retry_scheduled
+    _retry_scheduled = False
+    process_gui_tasks(reschedule=False)
+
+
+def _schedule_deferred_retry(delay_ms: int = _DEFER_RETRY_MS) -> None:
+    """Re-run a deferred wake shortly instead of waiting for the heartbeat."""
+    global _retry_scheduled
+    if _retry_scheduled or _rpc_request_queue.empty():
+        return
+    _retry_scheduled = True
+    QtCore.QTimer.singleShot(delay_ms, _retry_deferred)
+
+
 _waker: "_WakeSignal | None" = None
 
 
@@ -100,7 +158,8 @@ def process_gui_tasks(reschedule: bool = True) -> None:
     triggering a nested ``process_gui_tasks`` call that corrupts FreeCAD state.
 
     ``reschedule=False`` is used by the immediate-wake path so it does not
-    start a second heartbeat chain alongside the existing 500 ms one.
+    start a second heartbeat chain alongside the existing one; if that path
+    has to defer, it schedules a short retry instead.
     """
     global _processing, _processing_since
     if _processing:
@@ -108,12 +167,14 @@ def process_gui_tasks(reschedule: bool = True) -> None:
 
     shutdown = False
     try:
-        if QtWidgets.QApplication.mouseButtons() != QtCore.Qt.NoButton:
-            return  # user is dragging; defer to next tick
-        if QtWidgets.QApplication.activePopupWidget() is not None:
-            return  # context menu or popup open; defer to next tick
-        if QtWidgets.QApplication.activeModalWidget() is not None:
-            return  # modal dialog open; defer to next tick
+        if (
+            QtWidgets.QApplication.mouseButtons() != QtCore.Qt.NoButton  # user is dragging
+            or QtWidgets.QApplication.activePopupWidget() is not None  # context menu or popup open
+            or QtWidgets.QApplication.activeModalWidget() is not None  # modal dialog open
+        ):
+            if not reschedule:
+                _schedule_deferred_retry()
+            return  # defer to a later tick
 
         _processing = True
         _processing_since = time.monotonic()
@@ -128,8 +189,13 @@ def process_gui_tasks(reschedule: bool = True) -> None:
         if status_bar is not None:
             status_bar.showMessage("MCP: processing…")
         try:
-            while not _rpc_request_queue.empty():
-                task = _rpc_request_queue.get()
+            for _ in range(_MAX_TASKS_PER_TICK):
+                # get_nowait takes the queue lock once per task, where an
+                # empty() + get() pair took it twice.
+                try:
+                    task = _rpc_request_queue.get_nowait()
+                except queue.Empty:
+                    break
                 if task is _SHUTDOWN:
                     shutdown = True
                     return
@@ -140,6 +206,10 @@ def process_gui_tasks(reschedule: bool = True) -> None:
                         f"MCP RPC: unhandled exception in GUI task: {type(e).__name__}: {e}\n"
                         f"{traceback.format_exc()}"
                     )
+            else:
+                # Budget spent with tasks possibly left: let the event loop
+                # repaint and handle input, then carry on right away.
+                _schedule_deferred_retry(0)
         finally:
             if app is not None:
                 app.restoreOverrideCursor()
@@ -148,7 +218,7 @@ def process_gui_tasks(reschedule: bool = True) -> None:
     finally:
         _processing = False
         if not shutdown and reschedule:
-            QtCore.QTimer.singleShot(500, process_gui_tasks)
+            QtCore.QTimer.singleShot(HEARTBEAT_MS, process_gui_tasks)
 
 
 def request_shutdown() -> None:
@@ -159,41 +229,28 @@ def request_shutdown() -> None:
 def dispatch_to_gui(task: Callable[[], Any], timeout: float = 60) -> Any:
     """Run ``task`` on the GUI thread and return its result.
 
-    Uses a per-call response queue so a timeout in one call never corrupts
-    the response for a subsequent call. Wakes the GUI thread immediately via
-    a Qt signal instead of waiting for the next 500 ms heartbeat.
+    Uses a per-call result slot so a timeout in one call never corrupts the
+    response for a subsequent call. Wakes the GUI thread immediately via
+    a Qt signal instead of waiting for the next heartbeat.
 
     Returns the task's return value on success, an error string if the task
     raises, or ``{"success": False, "error": ...}`` on timeout.
     """
-    response_queue: "queue.Queue[Any]" = queue.Queue(maxsize=1)
-
-    def _wrapped() -> None:
-        try:
-            res = task()
-        except Exception as e:
-            FreeCAD.Console.PrintError(
-                f"MCP RPC: GUI task raised {type(e).__name__}: {e}\n"
-                f"{traceback.format_exc()}"
-            )
-            res = f"{type(e).__name__}: {e}"
-        response_queue.put(res)
-
-    _rpc_request_queue.put(_wrapped)
+    call = _PendingCall(task)
+    _rpc_request_queue.put(call)
     if _waker is not None:
         _waker.wake()  # immediate wake via Qt signal (thread-safe)
 
-    try:
-        return response_queue.get(timeout=timeout)
-    except queue.Empty:
-        # Diagnose why: if _processing is still True, the GUI thread is occupied
-        # by a long-running task that was queued before this one.
-        if _processing:
-            busy_for = time.monotonic() - _processing_since
-            hint = (
-                f" (GUI thread has been busy for {busy_for:.1f}s — "
-                "consider execute_code_async for heavy OCCT operations)"
-            )
-        else:
-            hint = ""
-        return {"success": False, "error": f"GUI dispatch timed out after {timeout}s{hint}"}
+    if call.done.wait(timeout):
+        return call.result
+    # Diagnose why: if _processing is still True, the GUI thread is occupied
+    # by a long-running task that was queued before this one.
+    if _processing:
+        busy_for = time.monotonic() - _processing_since
+        hint = (
+            f" (GUI thread has been busy for {busy_for:.1f}s — "
+            "consider execute_code_async for heavy OCCT operations)"
+        )
+    else:
+        hint = ""
+    return {"success": False, "error": f"GUI dispatch timed out after {timeout}s{hint}"}
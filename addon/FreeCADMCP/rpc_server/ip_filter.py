@@ -1,37 +1,146 @@
 """IP-filtered XML-RPC server and helpers for parsing allowed IP/subnet lists."""
 
+import functools
 import ipaddress
-import re
-from xmlrpc.server import SimpleXMLRPCServer
+import socket
+import socketserver
+import threading
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
 
 import FreeCAD
 
 
-class FilteredXMLRPCServer(SimpleXMLRPCServer):
-    """XML-RPC server that filters connections by allowed IP addresses/subnets."""
+class KeepAliveRequestHandler(SimpleXMLRPCRequestHandler):
+    """HTTP/1.1 handler so a client can reuse one connection across calls.
+
+    ``timeout`` bounds how long an idle connection may hold a worker thread
+    before it is closed. Once the server is stopping, no further request is
+    read from an open connection.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # small request/response payloads
+    timeout = 15
+
+    def handle_one_request(self):
+        if self.server.stopping.is_set():
+            self.close_connection = True
+            return
+        super().handle_one_request()
+        if self.server.stopping.is_set():
+            self.close_connection = True
+
+    def log_error(self, format, *args):
+        # Idle keep-alive connections timing out are routine, not errors.
+        if not format.startswith("Request timed out"):
+            super().log_error(format, *args)
+
+
+_ADDRESS_TYPES = {4: ipaddress.IPv4Address, 6: ipaddress.IPv6Address}
+_HOST_MASKS = {4: (1 << 32) - 1, 6: (1 << 128) - 1}
+
+
+class FilteredXMLRPCServer(socketserver.ThreadingMixIn, SimpleXMLRPCServer):
+    """XML-RPC server that filters connections by allowed IP addresses/subnets.
+
+    Each connection is served on its own daemon thread, so a call waiting on
+    the GUI thread does not block other clients (e.g. ``ping`` or
+    ``list_documents``) from being served; at most ``max_concurrent_calls``
+    calls execute at once. Daemon threads (rather than a
+    ``ThreadPoolExecutor``) keep an open keep-alive connection from holding
+    up FreeCAD's exit; ``server_close`` shuts those connections down so a
+    client admitted before the server stopped cannot keep issuing calls.
+    """
+
+    daemon_threads = True
+    max_concurrent_calls = 8
 
     def __init__(self, addr, allowed_ips_str="127.0.0.1", **kwargs):
         self._allowed_networks = _parse_allowed_ips(allowed_ips_str)
+        # version -> [(mask, {network_int, ...}), ...], longest prefix first:
+        # one masked set lookup per distinct prefix length instead of one
+        # compare per configured network.
+        by_mask = {}
+        for network_int, mask, version in self._allowed_networks:
+            by_mask.setdefault((version, mask), set()).add(network_int)
+        self._prefix_tables = {}
+        for (version, mask), nets in sorted(by_mask.items(), key=lambda kv: -kv[0][1]):
+            self._prefix_tables.setdefault(version, []).append((mask, frozenset(nets)))
+        # Single-host entries and admitted loopback addresses are accepted on
+        # a set lookup of the client string, without parsing the address.
+        exact = {
+            str(_ADDRESS_TYPES[version](network_int))
+            for network_int, mask, version in self._allowed_networks
+            if mask == _HOST_MASKS[version]
+        }
+        exact.update(
+            ip for ip in ("127.0.0.1", "::1")
+            if self._is_allowed(ipaddress.ip_address(ip))
+        )
+        self._exact_ips = frozenset(exact)
+        # Clients in CIDR ranges reconnect from the same few addresses; remember
+        # the verdict per address string instead of re-parsing it each time.
+        self._peer_allowed = functools.lru_cache(maxsize=256)(self._check_peer)
+        self._call_slots = threading.BoundedSemaphore(self.max_concurrent_calls)
+        self.stopping = threading.Event()
+        self._open_requests = set()
+        self._open_requests_lock = threading.Lock()
+        kwargs.setdefault("requestHandler", KeepAliveRequestHandler)
         super().__init__(addr, **kwargs)
 
-    def verify_request(self, request, client_address):
-        client_ip = client_address[0]
+    def process_request(self, request, client_address):
+        with self._open_requests_lock:
+            self._open_requests.add(request)
+        super().process_request(request, client_address)
+
+    def _marshaled_dispatch(self, data, dispatch_method=None, path=None):
+        # The slot is taken per call on the handler thread, so neither the
+        # accept loop nor an idle keep-alive connection ever waits on or holds
+        # one; a call beyond the cap waits for a free slot.
+        with self._call_slots:
+            return super()._marshaled_dispatch(data, dispatch_method, path)
+
+    def shutdown_request(self, request):
+        with self._open_requests_lock:
+            self._open_requests.discard(request)
+        super().shutdown_request(request)
+
+    def server_close(self):
+        self.stopping.set()
+        super().server_close()
+        with self._open_requests_lock:
+            open_requests = list(self._open_requests)
+        for request in open_requests:
+            try:
+                # Wakes a handler blocked reading the next keep-alive request;
+                # its thread then closes the socket itself.
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # already closed by the peer
+
+    def _is_allowed(self, addr):
+        addr_int = int(addr)
+        for mask, networks in self._prefix_tables.get(addr.version, ()):
+            if addr_int & mask in networks:
+                return True
+        return False
+
+    def _check_peer(self, client_ip):
         try:
-            addr = ipaddress.ip_address(client_ip)
-            for network in self._allowed_networks:
-                if addr in network:
-                    return True
+            return self._is_allowed(ipaddress.ip_address(client_ip))
         except ValueError:
-            pass
+            return False
+
+    def verify_request(self, request, client_address):
+        client_ip = client_address[0]
+        if client_ip in self._exact_ips or self._peer_allowed(client_ip):
+            return True
         FreeCAD.Console.PrintWarning(
             f"MCP RPC: Rejected connection from {client_ip}\n"
         )
         return False
 
 
-_COMMA_SEP_RE = re.compile(r"^\s*[^,\s]+(\s*,\s*[^,\s]+)*\s*$")
-
-
 def validate_allowed_ips(allowed_ips_str):
     """Validate a comma-separated string of IP addresses/subnets.
 
@@ -50,15 +159,17 @@ def validate_allowed_ips(allowed_ips_str):
     if not allowed_ips_str or not allowed_ips_str.strip():
         return [], ["Input must not be empty."]
 
-    if not _COMMA_SEP_RE.match(allowed_ips_str):
+    entries = [entry.strip() for entry in allowed_ips_str.split(",")]
+    # An empty entry means a leading/trailing/double comma; inner whitespace
+    # means two entries are missing the comma between them.
+    if any(not entry or len(entry.split()) > 1 for entry in entries):
         return [], [
             "Malformed list — check for leading/trailing commas, "
             "double commas, or missing separators."
         ]
 
     valid = []
-    for entry in allowed_ips_str.split(","):
-        entry = entry.strip()
+    for entry in entries:
         try:
             ipaddress.ip_network(entry, strict=False)
             valid.append(entry)
@@ -68,8 +179,17 @@ def validate_allowed_ips(allowed_ips_str):
 
 
 def _parse_allowed_ips(allowed_ips_str):
-    """Parse a comma-separated string of IPs/subnets into a list of ip_network objects."""
+    """Parse a comma-separated string of IPs/subnets into ``(network_int, mask_int, version)`` tuples.
+
+    ``FilteredXMLRPCServer`` groups these by prefix length into its lookup
+    tables, so a client address is matched with one masked set lookup per
+    distinct prefix; the order of the returned list does not matter.
+    """
     valid, errors = validate_allowed_ips(allowed_ips_str)
     for msg in errors:
         FreeCAD.Console.PrintWarning(f"MCP RPC: {msg}, skipping\n")
-    return [ipaddress.ip_network(entry, strict=False) for entry in valid]
+    networks = []
+    for entry in valid:
+        net = ipaddress.ip_network(entry, strict=False)
+        networks.append((int(net.network_address), int(net.netmask), net.version))
+    return networks
@@ -7,7 +7,6 @@ public entry point that selects the branch.
 """
 
 import FreeCAD
-import ObjectsFem
 
 from rpc_server.property_mapper import Object, set_object_property
 
@@ -18,6 +17,7 @@ def _create_fem_mesh(doc: FreeCAD.Document, obj: Object) -> None:
     Accepts both the FreeCAD 0.x and 1.x property names (``Part``/``Shape``,
     ``ElementSize{Max,Min}``/``CharacteristicLength{Max,Min}``).
     """
+    import ObjectsFem
     from femmesh.gmshtools import GmshTools
 
     res = getattr(doc, obj.analysis).addObject(
@@ -44,6 +44,7 @@ def _create_fem_mesh(doc: FreeCAD.Document, obj: Object) -> None:
         target_param = legacy_to_new.get(param, param)
         if target_param and hasattr(res, target_param):
             setattr(res, target_param, value)
+    # Gmsh meshes the recomputed geometry, so this one cannot be deferred.
     doc.recompute()
 
     GmshTools(res).create_mesh()
@@ -54,6 +55,8 @@ def _create_fem_mesh(doc: FreeCAD.Document, obj: Object) -> None:
 
 def _create_fem_object(doc: FreeCAD.Document, obj: Object) -> None:
     """Create a ``Fem::*`` object via the appropriate ``ObjectsFem.makeXxx`` factory."""
+    import ObjectsFem
+
     fem_make_methods = {
         "MaterialCommon": ObjectsFem.makeMaterialSolid,
         "AnalysisPython": ObjectsFem.makeAnalysis,
@@ -106,7 +109,8 @@ def create_object_gui(doc_name: str, obj: Object):
         else:
             _create_generic_object(doc, obj)
 
-        doc.recompute()
+        if not obj.defer_recompute:
+            doc.recompute()
         return True
     except Exception as e:
         return str(e)
@@ -1,12 +1,30 @@
 import os
+from collections.abc import Iterator
 
 import FreeCAD
 import FreeCADGui
 
 
+# The user app data dir is fixed for the session, so resolve the library
+# root once.
+_PARTS_LIB_PATH = os.path.normpath(
+    os.path.join(FreeCAD.getUserAppDataDir(), "Mod", "parts_library")
+)
+_PARTS_LIB_PREFIX = _PARTS_LIB_PATH + os.sep
+
+# File suffixes that count as parts; str.endswith accepts the tuple directly.
+_ALLOWED_SUFFIXES = (".FCStd",)
+
+
 def insert_part_from_library(relative_path):
-    parts_lib_path = os.path.join(FreeCAD.getUserAppDataDir(), "Mod", "parts_library")
-    part_path = os.path.join(parts_lib_path, relative_path)
+    part_path = os.path.normpath(os.path.join(_PARTS_LIB_PATH, relative_path))
+
+    # Reject "../" or absolute paths that would escape the library.
+    if os.path.commonpath((_PARTS_LIB_PATH, part_path)) != _PARTS_LIB_PATH:
+        raise ValueError(f"Path is outside the parts library: {relative_path}")
+
+    if not part_path.endswith(_ALLOWED_SUFFIXES):
+        raise ValueError(f"Not a FreeCAD document: {relative_path}")
 
     if not os.path.exists(part_path):
         raise FileNotFoundError(f"Not found: {part_path}")
@@ -19,20 +37,70 @@ def insert_part_from_library(relative_path):
     FreeCADGui.ActiveDocument.mergeProject(part_path)
 
 
-def get_parts_list() -> list[str]:
-    parts_lib_path = os.path.join(FreeCAD.getUserAppDataDir(), "Mod", "parts_library")
+# (parts, {directory: st_mtime_ns}) from the last scan, or None when stale.
+_parts_cache: tuple[tuple[str, ...], dict[str, int]] | None = None
+
+
+def _iter_parts(dir_mtimes: dict[str, int] | None = None) -> Iterator[str]:
+    """Lazily yield library-relative paths of every ``.FCStd`` in the parts library.
+
+    Walks with ``os.scandir`` so the is_dir/is_file checks reuse the type
+    information returned by readdir instead of stat-ing every entry, and
+    derives the relative path by slicing off the known root prefix.
 
-    if not os.path.exists(parts_lib_path):
+    When ``dir_mtimes`` is given, the mtime of every visited directory is
+    recorded into it so a later call can tell whether a rescan is needed.
+    Directories that cannot be read are skipped.
+    """
+    prefix_len = len(_PARTS_LIB_PREFIX)
+
+    def _scan(directory):
+        try:
+            if dir_mtimes is not None:
+                # Stat before listing: a file added mid-scan then shows up as a
+                # changed mtime on the next validation instead of being missed.
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+            it = os.scandir(directory)
+        except OSError:
+            # Skip unreadable or vanished directories, as os.walk does.
+            return
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan(entry.path)
+                elif entry.name.endswith(_ALLOWED_SUFFIXES) and entry.is_file():
+                    yield entry.path[prefix_len:]
+
+    return _scan(_PARTS_LIB_PATH)
+
+
+def _dirs_unchanged(dir_mtimes: dict[str, int]) -> bool:
+    try:
+        return all(os.stat(d).st_mtime_ns == mtime for d, mtime in dir_mtimes.items())
+    except OSError:
+        return False
+
+
+def get_parts_list() -> tuple[str, ...]:
+    """Return the library-relative paths of all parts in the parts library.
+
+    The result is cached and revalidated by comparing the mtime of every
+    library directory, which is far cheaper than a full rescan but still
+    picks up parts added or removed anywhere in the tree.
+    """
+    global _parts_cache
+    if not os.path.exists(_PARTS_LIB_PATH):
         # Library addon not installed — return empty so the caller can show a
         # friendly "no parts found" message instead of raising over XML-RPC.
-        return []
-
-    parts = []
+        return ()
 
-    for root, _, files in os.walk(parts_lib_path):
-        for file in files:
-            if file.endswith(".FCStd"):
-                relative_path = os.path.relpath(os.path.join(root, file), parts_lib_path)
-                parts.append(relative_path)
+    cached = _parts_cache
+    if cached is not None and _dirs_unchanged(cached[1]):
+        return cached[0]
 
+    dir_mtimes: dict[str, int] = {}
+    # A tuple is immutable, so the cached result is safe to hand out to
+    # every caller without copying.
+    parts = tuple(_iter_parts(dir_mtimes))
+    _parts_cache = (parts, dir_mtimes)
     return parts
@@ -12,6 +12,7 @@ class Object:
     type: str | None = None
     analysis: str | None = None
     properties: dict[str, Any] = field(default_factory=dict)
+    defer_recompute: bool = False  # caller recomputes once after a batch
 
 
 def _to_shape_color(val: Any) -> tuple[float, float, float, float]:
@@ -64,73 +65,103 @@ def resolve_references(doc: FreeCAD.Document, val: Any) -> list[tuple[Any, Any]]
     return refs
 
 
+def _xyz(d: dict[str, Any], z: float = 0) -> tuple[Any, Any, Any]:
+    """Read ``x``/``y``/``z`` from a JSON point, defaulting missing axes."""
+    return d.get("x", 0), d.get("y", 0), d.get("z", z)
+
+
+def _set_placement(doc, obj, prop, val):
+    if not isinstance(val, dict):
+        return _set_document_property(doc, obj, prop, val)
+    pos = val.get("Base") or val.get("Position") or {}
+    rot = val.get("Rotation") or {}
+    axis = rot.get("Axis") or {}
+    placement = FreeCAD.Placement(
+        FreeCAD.Vector(*_xyz(pos)),
+        FreeCAD.Rotation(FreeCAD.Vector(*_xyz(axis, z=1)), rot.get("Angle", 0)),
+    )
+    setattr(obj, prop, placement)
+
+
+def _set_link(doc, obj, prop, val):
+    """Resolve an object name to the object for link properties like ``Base``."""
+    if not isinstance(val, str):
+        return _set_document_property(doc, obj, prop, val)
+    ref_obj = doc.getObject(val)
+    if ref_obj:
+        setattr(obj, prop, ref_obj)
+    else:
+        raise ValueError(f"Referenced object '{val}' not found.")
+
+
+def _set_references(doc, obj, prop, val):
+    if not isinstance(val, list):
+        return _set_document_property(doc, obj, prop, val)
+    setattr(obj, prop, resolve_references(doc, val))
+
+
+def _set_document_property(doc, obj, prop, val):
+    """Fallback for properties of the object itself (dict values become Vectors)."""
+    # Check the incoming value first: reading the current value goes through
+    # FreeCAD's property system and is only needed for dict inputs.
+    if isinstance(val, dict) and isinstance(getattr(obj, prop), FreeCAD.Vector):
+        val = FreeCAD.Vector(*_xyz(val))
+    setattr(obj, prop, val)
+
+
+def _set_shape_color(doc, obj, prop, val):
+    # ShapeColor is a property of the ViewObject
+    if not isinstance(val, (list, tuple)):
+        return _set_attribute(doc, obj, prop, val)
+    setattr(obj.ViewObject, prop, _to_shape_color(val))
+
+
+def _set_view_object(doc, obj, prop, val):
+    if not isinstance(val, dict):
+        return _set_attribute(doc, obj, prop, val)
+    view = obj.ViewObject  # resolved through the GUI document; fetch once
+    for k, v in val.items():
+        if k == "ShapeColor":
+            v = _to_shape_color(v)
+        setattr(view, k, v)
+
+
+def _set_attribute(doc, obj, prop, val):
+    setattr(obj, prop, val)
+
+
+# Handlers for names found in ``obj.PropertiesList``; anything else goes
+# through ``_set_document_property``.
+_PROPERTY_HANDLERS = {
+    "Placement": _set_placement,
+    "Base": _set_link,
+    "Tool": _set_link,
+    "Source": _set_link,
+    "Profile": _set_link,
+    "References": _set_references,
+}
+
+# Handlers for names that are not document-object properties; anything else
+# is assigned as-is.
+_EXTRA_HANDLERS = {
+    "ShapeColor": _set_shape_color,
+    "ViewObject": _set_view_object,
+}
+
+
 def set_object_property(
     doc: FreeCAD.Document, obj: FreeCAD.DocumentObject, properties: dict[str, Any]
 ):
     failures = []
+    # PropertiesList builds a fresh list on every access; snapshot it once.
+    own_props = frozenset(obj.PropertiesList)
     for prop, val in properties.items():
         try:
-            if prop in obj.PropertiesList:
-                if prop == "Placement" and isinstance(val, dict):
-                    if "Base" in val:
-                        pos = val["Base"]
-                    elif "Position" in val:
-                        pos = val["Position"]
-                    else:
-                        pos = {}
-                    rot = val.get("Rotation", {})
-                    placement = FreeCAD.Placement(
-                        FreeCAD.Vector(
-                            pos.get("x", 0),
-                            pos.get("y", 0),
-                            pos.get("z", 0),
-                        ),
-                        FreeCAD.Rotation(
-                            FreeCAD.Vector(
-                                rot.get("Axis", {}).get("x", 0),
-                                rot.get("Axis", {}).get("y", 0),
-                                rot.get("Axis", {}).get("z", 1),
-                            ),
-                            rot.get("Angle", 0),
-                        ),
-                    )
-                    setattr(obj, prop, placement)
-
-                elif isinstance(getattr(obj, prop), FreeCAD.Vector) and isinstance(
-                    val, dict
-                ):
-                    vector = FreeCAD.Vector(
-                        val.get("x", 0), val.get("y", 0), val.get("z", 0)
-                    )
-                    setattr(obj, prop, vector)
-
-                elif prop in ["Base", "Tool", "Source", "Profile"] and isinstance(
-                    val, str
-                ):
-                    ref_obj = doc.getObject(val)
-                    if ref_obj:
-                        setattr(obj, prop, ref_obj)
-                    else:
-                        raise ValueError(f"Referenced object '{val}' not found.")
-
-                elif prop == "References" and isinstance(val, list):
-                    setattr(obj, prop, resolve_references(doc, val))
-
-                else:
-                    setattr(obj, prop, val)
-            # ShapeColor is a property of the ViewObject
-            elif prop == "ShapeColor" and isinstance(val, (list, tuple)):
-                setattr(obj.ViewObject, prop, _to_shape_color(val))
-
-            elif prop == "ViewObject" and isinstance(val, dict):
-                for k, v in val.items():
-                    if k == "ShapeColor":
-                        setattr(obj.ViewObject, k, _to_shape_color(v))
-                    else:
-                        setattr(obj.ViewObject, k, v)
-
+            if prop in own_props:
+                handler = _PROPERTY_HANDLERS.get(prop, _set_document_property)
             else:
-                setattr(obj, prop, val)
+                handler = _EXTRA_HANDLERS.get(prop, _set_attribute)
+            handler(doc, obj, prop, val)
 
         except Exception as e:
             FreeCAD.Console.PrintError(f"Property '{prop}' assignment error: {e}\n")
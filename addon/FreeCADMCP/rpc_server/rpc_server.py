@@ -1,19 +1,25 @@
 import FreeCAD
 import FreeCADGui
 
-import contextlib
 import base64
+import contextlib
+import functools
 import io
+import json
 import os
+import struct
 import tempfile
 import threading
+import traceback
 from typing import Any
+from xmlrpc.client import Binary
 
 from PySide import QtCore
 
 from rpc_server.commands import register_commands, schedule_toggle_sync
 from rpc_server.fem_executor import run_fem_analysis as _run_fem_analysis
 from rpc_server.gui_dispatch import (
+    HEARTBEAT_MS,
     cleanup_waker,
     dispatch_to_gui,
     init_waker,
@@ -24,13 +30,86 @@ from rpc_server.ip_filter import FilteredXMLRPCServer, validate_allowed_ips
 from rpc_server.object_factory import create_object_gui
 from rpc_server.parts_library import get_parts_list, insert_part_from_library
 from rpc_server.property_mapper import Object, set_object_property
-from rpc_server.serialize import serialize_object
+from rpc_server.serialize import serialize_object, serialize_objects
 from rpc_server.settings import load_settings, save_settings
-from rpc_server.view_manager import save_active_screenshot
+from rpc_server.view_manager import VIEW_NAMES, save_active_screenshot
 
 rpc_server_thread = None
 rpc_server_instance = None
 
+# RAM-backed scratch directory for screenshots (Linux), so the PNG written by
+# saveImage and read straight back never touches the disk.
+_SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def _mkstemp_png() -> tuple[int, str]:
+    if _SHM_DIR is not None:
+        try:
+            return tempfile.mkstemp(suffix=".png", dir=_SHM_DIR)
+        except OSError:
+            pass  # e.g. sandboxed (snap) builds may not be allowed to write there
+    return tempfile.mkstemp(suffix=".png")
+
+
+# Per-thread stdout capture buffer for execute_code, rewound between calls.
+_output_buffers = threading.local()
+_MAX_RETAINED_OUTPUT = 1 << 20  # don't keep a buffer alive after a huge print
+
+
+def _acquire_output_buffer() -> io.StringIO:
+    buf = getattr(_output_buffers, "buf", None)
+    if buf is None:
+        buf = _output_buffers.buf = io.StringIO()
+    else:
+        buf.seek(0)
+        buf.truncate(0)
+    return buf
+
+
+def _release_output_buffer(buf: io.StringIO, reusable: bool) -> None:
+    if not reusable or buf.tell() > _MAX_RETAINED_OUTPUT:
+        _output_buffers.buf = None
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_code(code: str):
+    """Compile an execute_code snippet once; agents often resend the same one."""
+    return compile(code, "<string>", "exec")
+
+
+# Persistent globals for execute_code snippets: names bound by one call stay
+# visible to the next, and snippets cannot clobber this module's own globals.
+# Each call runs in a copy; execute_code merges its bindings back afterwards on
+# the GUI thread, while background (async) snippets never write to it.
+# Snippets used to run in this module's globals, so the modules it imported
+# stay available without an import.
+_exec_namespace: dict[str, Any] = {
+    "__name__": "__freecad_mcp__",
+    "__builtins__": __builtins__,
+    "FreeCAD": FreeCAD,
+    "App": FreeCAD,
+    "FreeCADGui": FreeCADGui,
+    "Gui": FreeCADGui,
+    "QtCore": QtCore,
+    "base64": base64,
+    "contextlib": contextlib,
+    "io": io,
+    "json": json,
+    "os": os,
+    "struct": struct,
+    "tempfile": tempfile,
+    "threading": threading,
+    "traceback": traceback,
+}
+
+
+def _recompute_from(doc, obj) -> None:
+    """Recompute ``obj`` and what depends on it rather than the whole document."""
+    try:
+        doc.recompute([obj, *obj.InListRecursive])
+    except TypeError:  # FreeCAD < 0.19: recompute() takes no object list
+        doc.recompute()
+
 
 def _ok(res) -> bool:
     """True when a GUI-thread handler returned success."""
@@ -58,33 +137,136 @@ class FreeCADRPC:
             return {"success": True, "document_name": name}
         return _err(res)
 
+    # The single-object mutators accept a "DeferRecompute" flag (an extra
+    # argument for delete_object) so a client can chain several edits and
+    # then call recompute_document once. create/edit also accept
+    # "Screenshot": the response then carries a "screenshot" entry (PNG
+    # Binary, or None if the view cannot capture), saving the client a
+    # separate get_active_screenshot round trip.
     def create_object(self, doc_name, obj_data: dict[str, Any]):
+        task, done = self._create_object_call(
+            doc_name, obj_data, obj_data.get("DeferRecompute", False)
+        )
+        res = dispatch_to_gui(task)
+        if _ok(res):
+            return self._with_screenshot(done, obj_data.get("Screenshot", False))
+        return _err(res)
+
+    def edit_object(self, doc_name: str, obj_name: str, properties: dict[str, Any]) -> dict[str, Any]:
+        task, done = self._edit_object_call(
+            doc_name, obj_name, properties, properties.get("DeferRecompute", False)
+        )
+        res = dispatch_to_gui(task)
+        if _ok(res):
+            return self._with_screenshot(done, properties.get("Screenshot", False))
+        return _err(res)
+
+    def delete_object(self, doc_name: str, obj_name: str, defer_recompute: bool = False):
+        task, done = self._delete_object_call(doc_name, obj_name, defer_recompute)
+        res = dispatch_to_gui(task)
+        return done if _ok(res) else _err(res)
+
+    def recompute_document(self, doc_name: str) -> dict[str, Any]:
+        res = dispatch_to_gui(lambda: self._recompute_document_gui(doc_name))
+        if _ok(res):
+            return {"success": True, "document_name": doc_name}
+        return _err(res)
+
+    def batch(self, calls: list[dict[str, Any]]) -> list[dict[str, Any]] | dict[str, Any]:
+        """Run several object create/edit/delete calls in a single GUI task.
+
+        Each entry is ``{"method": name, "params": [...]}`` where ``name`` is
+        one of ``create_object``, ``edit_object`` or ``delete_object`` and
+        ``params`` are that method's positional arguments. Returns one result
+        per entry, in order, shaped like the single-call responses; a failing
+        entry does not stop the rest.
+
+        Per-object recomputes are skipped; each touched document is
+        recomputed once after the last entry.
+        """
+        planned = []
+        for call in calls:
+            try:
+                make_call = self._BATCH_CALLS[call["method"]]
+                params = call.get("params", ())
+                doc_name = params[0]
+                task, done = make_call(self, *params, defer_recompute=True)
+            except Exception as e:
+                planned.append(f"Invalid batch entry {call!r}: {type(e).__name__}: {e}")
+            else:
+                planned.append((task, done, doc_name))
+
+        def run_all():
+            results = []
+            doc_names = []  # documents with at least one successful entry
+            for entry in planned:
+                if isinstance(entry, str):
+                    results.append(entry)
+                    continue
+                task, _, doc_name = entry
+                try:
+                    res = task()
+                except Exception as e:
+                    res = f"{type(e).__name__}: {e}"
+                results.append(res)
+                if _ok(res) and doc_name not in doc_names:
+                    doc_names.append(doc_name)
+            for doc_name in doc_names:
+                try:
+                    FreeCAD.getDocument(doc_name).recompute()
+                except Exception as e:
+                    FreeCAD.Console.PrintError(
+                        f"MCP RPC: batch recompute of '{doc_name}' failed: {e}\n"
+                    )
+            return results
+
+        res = dispatch_to_gui(run_all, timeout=self.TIMEOUT)
+        if not isinstance(res, list):
+            return _err(res)
+        return [
+            entry[1] if _ok(r) else _err(r)
+            for entry, r in zip(planned, res)
+        ]
+
+    # Each builder returns ``(gui_task, success_response)`` so the single-call
+    # methods and ``batch`` share argument handling.
+    def _create_object_call(self, doc_name, obj_data: dict[str, Any], defer_recompute=False):
         obj = Object(
             name=obj_data.get("Name", "New_Object"),
             type=obj_data["Type"],
             analysis=obj_data.get("Analysis", None),
             properties=obj_data.get("Properties", {}),
+            defer_recompute=defer_recompute,
+        )
+        return (
+            lambda: self._create_object_gui(doc_name, obj),
+            {"success": True, "object_name": obj.name},
         )
-        res = dispatch_to_gui(lambda: self._create_object_gui(doc_name, obj))
-        if _ok(res):
-            return {"success": True, "object_name": obj.name}
-        return _err(res)
 
-    def edit_object(self, doc_name: str, obj_name: str, properties: dict[str, Any]) -> dict[str, Any]:
+    def _edit_object_call(
+        self, doc_name: str, obj_name: str, properties: dict[str, Any], defer_recompute=False
+    ):
         obj = Object(
             name=obj_name,
             properties=properties.get("Properties", {}),
+            defer_recompute=defer_recompute,
+        )
+        return (
+            lambda: self._edit_object_gui(doc_name, obj),
+            {"success": True, "object_name": obj.name},
         )
-        res = dispatch_to_gui(lambda: self._edit_object_gui(doc_name, obj))
-        if _ok(res):
-            return {"success": True, "object_name": obj.name}
-        return _err(res)
 
-    def delete_object(self, doc_name: str, obj_name: str):
-        res = dispatch_to_gui(lambda: self._delete_object_gui(doc_name, obj_name))
-        if _ok(res):
-            return {"success": True, "object_name": obj_name}
-        return _err(res)
+    def _delete_object_call(self, doc_name: str, obj_name: str, defer_recompute=False):
+        return (
+            lambda: self._delete_object_gui(doc_name, obj_name, defer_recompute),
+            {"success": True, "object_name": obj_name},
+        )
+
+    _BATCH_CALLS = {
+        "create_object": _create_object_call,
+        "edit_object": _edit_object_call,
+        "delete_object": _delete_object_call,
+    }
 
 
     def reload_document(self, doc_name: str) -> dict[str, Any]:
@@ -131,16 +313,18 @@ class FreeCADRPC:
             # GUI thread and other concurrent work. Background code should report
             # via FreeCAD.Console (which is thread-safe) instead.
             try:
-                exec(code, globals())
+                exec(_compile_code(code), namespace)
                 FreeCAD.Console.PrintMessage("Async code execution completed.\n")
             except Exception as e:
-                import traceback as _tb
                 FreeCAD.Console.PrintError(
-                    f"Async code error: {e}\n{_tb.format_exc()}"
+                    f"Async code error: {e}\n{traceback.format_exc()}"
                 )
             finally:
                 _clear_status()
 
+        # A private copy, so this thread never races execute_code on the GUI
+        # thread over shared names such as ``__result__`` or ``doc``.
+        namespace = dict(_exec_namespace)
         _set_status("MCP: running background task…")
         threading.Thread(target=worker, daemon=True).start()
         return {"success": True, "message": "Code execution started in background."}
@@ -153,20 +337,44 @@ class FreeCADRPC:
         Use execute_code_async for heavy OCCT boolean ops (fuse/cut)
         that would block the GUI thread too long.
         """
-        output_buffer = io.StringIO()
+        output_buffer = _acquire_output_buffer()
+        returned = []
 
         def task():
-            with contextlib.redirect_stdout(output_buffer):
-                exec(code, globals())
+            namespace = dict(_exec_namespace)
+            try:
+                with contextlib.redirect_stdout(output_buffer):
+                    exec(_compile_code(code), namespace)
+            finally:
+                # Snippets may assign ``__result__`` to hand back structured
+                # data instead of printing it; it belongs to this call only.
+                if "__result__" in namespace:
+                    returned.append(namespace.pop("__result__"))
+                _exec_namespace.update(namespace)
             return True
 
         res = dispatch_to_gui(task, timeout=self.EXECUTE_CODE_TIMEOUT)
+        output = output_buffer.getvalue()
+        # On timeout (a dict) the task may still be printing into the buffer,
+        # so hand it over to that task instead of rewinding it for the next call.
+        _release_output_buffer(output_buffer, reusable=not isinstance(res, dict))
         if _ok(res):
             FreeCAD.Console.PrintMessage("Python code executed successfully.\n")
-            return {
+            response = {
                 "success": True,
-                "message": "Python code executed successfully.\nOutput: " + output_buffer.getvalue(),
+                "message": "Python code executed successfully.\nOutput: " + output,
+                # Raw stdout, so callers need not slice it back out of "message".
+                "output": output,
             }
+            if returned:
+                # JSON text, so any value survives XML-RPC marshalling.
+                try:
+                    response["result"] = json.dumps(
+                        returned[0], ensure_ascii=False, default=str
+                    )
+                except (TypeError, ValueError, RecursionError) as e:  # e.g. circular
+                    return _err(f"Cannot serialize __result__: {type(e).__name__}: {e}")
+            return response
         # Log the offending code (truncated) to make errors traceable
         code_preview = code if len(code) <= 800 else code[:800] + "\n...(truncated)"
         FreeCAD.Console.PrintError(
@@ -176,23 +384,28 @@ class FreeCADRPC:
         return _err(res)
 
     def get_objects(self, doc_name):
-        # FreeCAD.getDocument raises (not returns None) for an unknown name.
-        try:
-            doc = FreeCAD.getDocument(doc_name)
-        except Exception:
-            return []
-        return [serialize_object(obj) for obj in doc.Objects]
+        # Serialize the whole document in one GUI task: a single thread hop,
+        # and the document cannot change under us mid-traversal.
+        res = dispatch_to_gui(lambda: self._get_objects_gui(doc_name))
+        # A str means the task raised; a timeout is already a failure dict.
+        return _err(res) if isinstance(res, str) else res
+
+    def get_objects_binary(self, doc_name):
+        """Like ``get_objects``, but as compact JSON wrapped in ``Binary``.
+
+        A large object list costs far less as one base64 blob than as nested
+        XML-RPC structs, on both the encoding and the parsing side.
+        """
+        res = dispatch_to_gui(lambda: self._get_objects_gui(doc_name))
+        if isinstance(res, str):
+            return _err(res)
+        if isinstance(res, dict):
+            return res  # timeout
+        return Binary(json.dumps(res, separators=(",", ":"), default=str).encode("utf-8"))
 
     def get_object(self, doc_name, obj_name):
-        # FreeCAD.getDocument raises (not returns None) for an unknown name.
-        try:
-            doc = FreeCAD.getDocument(doc_name)
-        except Exception:
-            return None
-        obj = doc.getObject(obj_name)
-        if obj:
-            return serialize_object(obj)
-        return None
+        res = dispatch_to_gui(lambda: self._get_object_gui(doc_name, obj_name))
+        return _err(res) if isinstance(res, str) else res
 
     def insert_part_from_library(self, relative_path):
         res = dispatch_to_gui(lambda: self._insert_part_from_library(relative_path))
@@ -212,33 +425,56 @@ class FreeCADRPC:
         width: int | None = None,
         height: int | None = None,
         focus_object: str | None = None,
-    ) -> str:
+    ) -> str | None:
         """Get a screenshot of the active view as a base64-encoded PNG string.
 
         Returns None if the active view does not support screenshots
         (e.g., TechDraw or Spreadsheet workbench).
         """
-        fd, tmp_path = tempfile.mkstemp(suffix=".png")
-        os.close(fd)
+        png = self._capture_screenshot(view_name, width, height, focus_object)
+        return base64.b64encode(png).decode("utf-8") if png is not None else None
 
-        def task():
-            try:
-                active_view = FreeCADGui.ActiveDocument.ActiveView
-            except Exception:
-                return False
-            if active_view is None or not hasattr(active_view, "saveImage"):
-                view_type = type(active_view).__name__ if active_view is not None else "None"
-                FreeCAD.Console.PrintWarning(
-                    f"MCP RPC: view type '{view_type}' does not support screenshots\n"
-                )
-                return False
-            return save_active_screenshot(tmp_path, view_name, width, height, focus_object)
+    def get_active_screenshot_bytes(
+        self,
+        view_name: str = "Isometric",
+        width: int | None = None,
+        height: int | None = None,
+        focus_object: str | None = None,
+    ) -> Binary | None:
+        """Like ``get_active_screenshot``, but as raw PNG bytes.
+
+        The bytes are wrapped in ``xmlrpc.client.Binary`` so XML-RPC
+        base64-encodes them exactly once on the wire.
+        """
+        png = self._capture_screenshot(view_name, width, height, focus_object)
+        return Binary(png) if png is not None else None
+
+    def _capture_screenshot(
+        self,
+        view_name: str,
+        width: int | None,
+        height: int | None,
+        focus_object: str | None,
+    ) -> bytes | None:
+        # Reject unknown view names before creating a temp file or waking
+        # the GUI thread.
+        if view_name not in VIEW_NAMES:
+            FreeCAD.Console.PrintWarning(
+                f"MCP RPC: screenshot failed: Invalid view name: {view_name}\n"
+            )
+            return None
+        fd, tmp_path = _mkstemp_png()
+        os.close(fd)
 
         try:
-            res = dispatch_to_gui(task)
+            # One GUI task both checks that the view supports screenshots and
+            # saves the image, so the active view is resolved only once.
+            res = dispatch_to_gui(
+                lambda: save_active_screenshot(tmp_path, view_name, width, height, focus_object)
+            )
             if _ok(res):
                 with open(tmp_path, "rb") as f:
-                    return base64.b64encode(f.read()).decode("utf-8")
+                    return f.read()
             if res is False:
                 return None
             FreeCAD.Console.PrintWarning(f"MCP RPC: screenshot failed: {res}\n")
@@ -247,6 +483,30 @@ class FreeCADRPC:
             if os.path.exists(tmp_path):
                 os.remove(tmp_path)
 
+    def _with_screenshot(self, response: dict[str, Any], wanted: bool) -> dict[str, Any]:
+        if not wanted:
+            return response
+        # Only clients that send the flag get here, so raw bytes are safe.
+        return {**response, "screenshot": self.get_active_screenshot_bytes()}
+
+    def _get_objects_gui(self, doc_name):
+        # FreeCAD.getDocument raises (not returns None) for an unknown name.
+        try:
+            doc = FreeCAD.getDocument(doc_name)
+        except Exception:
+            return []
+        return serialize_objects(doc.Objects)
+
+    def _get_object_gui(self, doc_name, obj_name):
+        try:
+            doc = FreeCAD.getDocument(doc_name)
+        except Exception:
+            return None
+        obj = doc.getObject(obj_name)
+        if obj:
+            return serialize_object(obj)
+        return None
+
     def _create_document_gui(self, name):
         doc = FreeCAD.newDocument(name)
         doc.recompute()
@@ -270,16 +530,25 @@ class FreeCADRPC:
 
         try:
             set_object_property(doc, obj_ins, obj.properties)
-            doc.recompute()
+            if not obj.defer_recompute:
+                _recompute_from(doc, obj_ins)
             FreeCAD.Console.PrintMessage(f"Object '{obj.name}' updated via RPC.\n")
             return True
         except Exception as e:
             return str(e)
 
+    def _recompute_document_gui(self, doc_name: str):
+        try:
+            doc = FreeCAD.getDocument(doc_name)
+        except Exception:
+            return f"Document '{doc_name}' not found.\n"
+        doc.recompute()
+        return True
+
     def _run_fem_analysis_gui(self, doc_name: str, analysis_name: str):
         return _run_fem_analysis(doc_name, analysis_name)
 
-    def _delete_object_gui(self, doc_name: str, obj_name: str):
+    def _delete_object_gui(self, doc_name: str, obj_name: str, defer_recompute: bool = False):
         try:
             doc = FreeCAD.getDocument(doc_name)
         except Exception:
@@ -287,8 +556,12 @@ class FreeCADRPC:
             return f"Document '{doc_name}' not found.\n"
 
         try:
+            target = doc.getObject(obj_name)
+            # Only objects that referenced the deleted one need recomputing.
+            has_dependents = target is not None and bool(target.InList)
             doc.removeObject(obj_name)
-            doc.recompute()
+            if has_dependents and not defer_recompute:
+                doc.recompute()
             FreeCAD.Console.PrintMessage(f"Object '{obj_name}' deleted via RPC.\n")
             return True
         except Exception as e:
@@ -354,6 +627,9 @@ def start_rpc_server(port=9875):
         (host, port), allowed_ips_str=allowed_ips, allow_none=True, logRequests=False
     )
     rpc_server_instance.register_instance(FreeCADRPC())
+    # system.multicall lets a client pipeline several calls in one request.
+    rpc_server_instance.register_introspection_functions()
+    rpc_server_instance.register_multicall_functions()
 
     def server_loop():
         FreeCAD.Console.PrintMessage(f"RPC Server started at {host}:{port}\n")
@@ -365,7 +641,7 @@ def start_rpc_server(port=9875):
     rpc_server_thread.start()
 
     init_waker()
-    QtCore.QTimer.singleShot(500, process_gui_tasks)
+    QtCore.QTimer.singleShot(HEARTBEAT_MS, process_gui_tasks)
 
     msg = f"RPC Server started at {host}:{port}."
     if remote_enabled:
@@ -380,6 +656,7 @@ def stop_rpc_server():
         request_shutdown()
         cleanup_waker()
         rpc_server_instance.shutdown()
+        rpc_server_instance.server_close()
         rpc_server_thread.join()
         rpc_server_instance = None
         rpc_server_thread = None
@@ -12,6 +12,7 @@ def _get_optional_app_type(name: str) -> type | tuple[type, ...] | None:
 
 
 _COLOR_TYPE = _get_optional_app_type("Color")
+_MISSING = object()
 
 
 def serialize_value(value):
@@ -37,15 +38,24 @@ def serialize_value(value):
         return str(value)
 
 
+def _count_elements(shape, element: str, attr: str) -> int:
+    # countElement counts in C++; Vertexes/Edges/Faces build a Python wrapper
+    # per sub-shape just so len() can discard them.
+    try:
+        return shape.countElement(element)
+    except AttributeError:  # older FreeCAD without TopoShape.countElement
+        return len(getattr(shape, attr))
+
+
 def serialize_shape(shape):
     if shape is None:
         return None
     return {
         "Volume": shape.Volume,
         "Area": shape.Area,
-        "VertexCount": len(shape.Vertexes),
-        "EdgeCount": len(shape.Edges),
-        "FaceCount": len(shape.Faces),
+        "VertexCount": _count_elements(shape, "Vertex", "Vertexes"),
+        "EdgeCount": _count_elements(shape, "Edge", "Edges"),
+        "FaceCount": _count_elements(shape, "Face", "Faces"),
     }
 
 
@@ -53,18 +63,15 @@ def serialize_view_object(view):
     if view is None:
         return None
     result = {}
-    try:
-        result["ShapeColor"] = serialize_value(view.ShapeColor)
-    except AttributeError:
-        pass
-    try:
-        result["Transparency"] = view.Transparency
-    except AttributeError:
-        pass
-    try:
-        result["Visibility"] = view.Visibility
-    except AttributeError:
-        pass
+    # Probe the attributes themselves: not every view provider registers
+    # these in PropertiesList even when it exposes them.
+    shape_color = getattr(view, "ShapeColor", _MISSING)
+    if shape_color is not _MISSING:
+        result["ShapeColor"] = serialize_value(shape_color)
+    for name in ("Transparency", "Visibility"):
+        value = getattr(view, name, _MISSING)
+        if value is not _MISSING:
+            result[name] = value
     return result
 
 
@@ -76,27 +83,36 @@ def serialize_object(obj):
             "Name": obj.Name,
             "Label": obj.Label,
             "FileName": obj.FileName,
-            "Objects": [serialize_object(child) for child in obj.Objects],
+            "Objects": serialize_objects(obj.Objects),
         }
     else:
-        result = {
+        properties = {}
+        for prop in obj.PropertiesList:
+            try:
+                properties[prop] = serialize_value(getattr(obj, prop))
+            except Exception as e:
+                properties[prop] = f"<error: {str(e)}>"
+
+        view = getattr(obj, "ViewObject", None)
+        return {
             "Name": obj.Name,
             "Label": obj.Label,
             "TypeId": obj.TypeId,
-            "Properties": {},
-            "Placement": serialize_value(getattr(obj, "Placement", None)),
-            "Shape": serialize_shape(getattr(obj, "Shape", None)),
-            "ViewObject": {},
+            "Properties": properties,
+            # Both are ordinary properties: reuse the serialized Placement, and
+            # only touch Shape when the object has one.
+            "Placement": properties.get("Placement", serialize_value(None)),
+            "Shape": serialize_shape(obj.Shape) if "Shape" in properties else None,
+            "ViewObject": serialize_view_object(view) if view is not None else {},
         }
 
-        for prop in obj.PropertiesList:
-            try:
-                result["Properties"][prop] = serialize_value(getattr(obj, prop))
-            except Exception as e:
-                result["Properties"][prop] = f"<error: {str(e)}>"
 
-        if hasattr(obj, "ViewObject") and obj.ViewObject is not None:
-            view = obj.ViewObject
-            result["ViewObject"] = serialize_view_object(view)
+def serialize_objects(objs):
+    """Serialize a sequence of document objects in a single traversal.
 
-        return result
+    Properties are still listed per instance rather than per ``TypeId``:
+    Python features and ``addProperty`` calls give objects of the same type
+    different property sets. This stays on the calling (GUI) thread: document
+    objects are not safe to read from worker threads.
+    """
+    return [serialize_object(obj) for obj in objs]
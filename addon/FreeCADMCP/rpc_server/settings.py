@@ -1,9 +1,11 @@
 """Persistence of MCP RPC server settings under FreeCAD's user app data dir."""
 
+import atexit
 import json
 import os
 
 import FreeCAD
+from PySide import QtCore
 
 
 _SETTINGS_FILENAME = "freecad_mcp_settings.json"
@@ -14,12 +16,26 @@ _DEFAULT_SETTINGS = {
     "auto_start_rpc": False,
 }
 
+_SAVE_DELAY_MS = 500  # coalesce bursts of toggles into one write
+
+_settings = None  # in-memory copy, loaded from disk on first use
+_settings_mtime = None  # st_mtime_ns of the file _settings was read from / written to
+_dirty = False  # True while a debounced write is pending
+_save_timer = None
+
 
 def _get_settings_path():
     return os.path.join(FreeCAD.getUserAppDataDir(), _SETTINGS_FILENAME)
 
 
-def load_settings():
+def _stat_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_from_disk():
     path = _get_settings_path()
     if os.path.exists(path):
         try:
@@ -34,10 +50,60 @@ def load_settings():
     return dict(_DEFAULT_SETTINGS)
 
 
-def save_settings(settings):
+def load_settings():
+    """Return a copy of the current settings.
+
+    The parsed file is cached and only re-read when its mtime changes, so
+    repeated calls cost one ``stat`` and a dict copy. A pending debounced
+    save always wins over the file on disk.
+    """
+    global _settings, _settings_mtime
+    if _settings is None or not _dirty:
+        mtime = _stat_mtime(_get_settings_path())
+        if _settings is None or mtime != _settings_mtime:
+            _settings = _load_from_disk()
+            _settings_mtime = mtime
+    return dict(_settings)
+
+
+def _write_settings(settings):
+    global _settings_mtime
     path = _get_settings_path()
     try:
         with open(path, "w") as f:
             json.dump(settings, f, indent=2)
+        _settings_mtime = _stat_mtime(path)
     except Exception as e:
         FreeCAD.Console.PrintError(f"Failed to save MCP settings: {e}\n")
+
+
+def _flush_settings():
+    """Write any pending settings to disk immediately."""
+    global _dirty
+    if _dirty:
+        _dirty = False
+        _write_settings(_settings)
+
+
+def save_settings(settings):
+    """Schedule ``settings`` to be written after a short debounce window.
+
+    The in-memory copy is updated immediately, so ``load_settings`` sees
+    the new values without touching the disk. Several saves in quick succession collapse into
+    a single disk write, and the last pending write is flushed at
+    interpreter exit.
+    """
+    global _settings, _dirty, _save_timer
+    if settings == _settings:
+        return  # e.g. a toggle re-applying the current value; nothing to write
+    _settings = dict(settings)
+    _dirty = True
+    if _save_timer is None:
+        _save_timer = QtCore.QTimer()
+        _save_timer.setSingleShot(True)
+        _save_timer.setInterval(_SAVE_DELAY_MS)
+        _save_timer.timeout.connect(_flush_settings)
+    _save_timer.start()
+
+
+atexit.register(_flush_settings)
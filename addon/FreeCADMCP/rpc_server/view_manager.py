@@ -8,17 +8,19 @@ import FreeCADGui
 from rpc_server.gui_dispatch import _flush_gui_events
 
 
+# view name -> (View3DInventor method, equivalent Std_View* command fallback)
 _VIEW_DISPATCH = {
-    "Isometric": "viewIsometric",
-    "Front": "viewFront",
-    "Top": "viewTop",
-    "Right": "viewRight",
-    "Back": "viewBack",
-    "Left": "viewLeft",
-    "Bottom": "viewBottom",
-    "Dimetric": "viewDimetric",
-    "Trimetric": "viewTrimetric",
+    "Isometric": ("viewIsometric", "Std_ViewIsometric"),
+    "Front": ("viewFront", "Std_ViewFront"),
+    "Top": ("viewTop", "Std_ViewTop"),
+    "Right": ("viewRight", "Std_ViewRight"),
+    "Back": ("viewBack", "Std_ViewRear"),
+    "Left": ("viewLeft", "Std_ViewLeft"),
+    "Bottom": ("viewBottom", "Std_ViewBottom"),
+    "Dimetric": ("viewDimetric", "Std_ViewDimetric"),
+    "Trimetric": ("viewTrimetric", "Std_ViewTrimetric"),
 }
+VIEW_NAMES = frozenset(_VIEW_DISPATCH)
 
 
 def _get_view_size(view: Any) -> tuple[int, int]:
@@ -42,35 +44,18 @@ def _resolve_screenshot_size(
     return resolved_width, resolved_height
 
 
-_STD_COMMAND_DISPATCH = {
-    "Isometric": "Std_ViewIsometric",
-    "Front": "Std_ViewFront",
-    "Top": "Std_ViewTop",
-    "Right": "Std_ViewRight",
-    "Back": "Std_ViewRear",
-    "Left": "Std_ViewLeft",
-    "Bottom": "Std_ViewBottom",
-    "Dimetric": "Std_ViewDimetric",
-    "Trimetric": "Std_ViewTrimetric",
-}
-
-
 def apply_view_orientation(view: Any, view_name: str) -> None:
-    method_name = _VIEW_DISPATCH.get(view_name)
-    if method_name is None:
+    entry = _VIEW_DISPATCH.get(view_name)
+    if entry is None:
         raise ValueError(f"Invalid view name: {view_name}")
-    if hasattr(view, method_name):
-        getattr(view, method_name)()
+    method_name, cmd = entry
+    method = getattr(view, method_name, None)
+    if method is not None:
+        method()
     else:
         # Fallback for views that lack the direct Python method
         # (e.g. some FreeCAD versions / view types)
-        cmd = _STD_COMMAND_DISPATCH.get(view_name)
-        if cmd:
-            FreeCADGui.runCommand(cmd)
-        else:
-            FreeCAD.Console.PrintWarning(
-                f"apply_view_orientation: no method or command for '{view_name}'\n"
-            )
+        FreeCADGui.runCommand(cmd)
 
 
 def save_active_screenshot(
@@ -82,14 +67,22 @@ def save_active_screenshot(
 ):
     """Save a PNG of the active view to ``save_path``.
 
-    Returns ``True`` on success, or an error string on failure (preserves the
-    legacy GUI-handler return contract).
+    Returns ``True`` on success, ``False`` when there is no active view or it
+    does not support screenshots (e.g. TechDraw or Spreadsheet), or an error
+    string on failure (preserves the legacy GUI-handler return contract).
     """
     try:
         view = FreeCADGui.ActiveDocument.ActiveView
-        if not hasattr(view, "saveImage"):
-            return "Current view does not support screenshots"
+    except Exception:
+        return False
+    if view is None or not hasattr(view, "saveImage"):
+        view_type = type(view).__name__ if view is not None else "None"
+        FreeCAD.Console.PrintWarning(
+            f"MCP RPC: view type '{view_type}' does not support screenshots\n"
+        )
+        return False
 
+    try:
         apply_view_orientation(view, view_name)
 
         focused_selection = False
@@ -71,7 +71,7 @@ def main():
     # Clean slate: drop the document if a previous run left it.
     try:
         if DOC in server.list_documents():
-            server.execute_code(f"import FreeCAD; FreeCAD.closeDocument('{DOC}')")
+            server.execute_code(f"import FreeCAD; FreeCAD.closeDocument({DOC!r})")
     except Exception as e:
         print(f"(cleanup skipped: {e})")
 
@@ -1,3 +1,5 @@
+import base64
+import json
 import logging
 import xmlrpc.client
 from typing import Any
@@ -23,10 +25,25 @@ class _TimeoutTransport(xmlrpc.client.Transport):
 
 
 
+def _screenshot_text(screenshot: xmlrpc.client.Binary | str | None) -> str | None:
+    # get_active_screenshot_bytes and bundled screenshots are raw PNG bytes;
+    # MCP image content wants base64 text, which get_active_screenshot sends.
+    if isinstance(screenshot, xmlrpc.client.Binary):
+        return base64.b64encode(screenshot.data).decode("ascii")
+    return screenshot
+
+
+def _method_unsupported(fault: xmlrpc.client.Fault, method: str) -> bool:
+    # What SimpleXMLRPCDispatcher raises for a method the addon does not have.
+    return f'method "{method}" is not supported' in fault.faultString
+
+
 class FreeCADConnection:
     def __init__(self, host: str = "localhost", port: int = 9875, timeout: float = 150):
         self._uri = f"http://{host}:{port}"
         self._timeout = timeout
+        self._binary_objects = True  # cleared if the addon lacks get_objects_binary
+        self._binary_screenshots = True  # cleared if it lacks get_active_screenshot_bytes
         self.server = self._make_proxy(timeout)
 
     def _make_proxy(self, timeout: float) -> xmlrpc.client.ServerProxy:
@@ -55,9 +72,19 @@ class FreeCADConnection:
     def edit_object(self, doc_name: str, obj_name: str, obj_data: dict[str, Any]) -> dict[str, Any]:
         return self.server.edit_object(doc_name, obj_name, obj_data)
 
-    def delete_object(self, doc_name: str, obj_name: str) -> dict[str, Any]:
+    def delete_object(
+        self, doc_name: str, obj_name: str, defer_recompute: bool = False
+    ) -> dict[str, Any]:
+        if defer_recompute:
+            return self.server.delete_object(doc_name, obj_name, True)
         return self.server.delete_object(doc_name, obj_name)
 
+    def recompute_document(self, doc_name: str) -> dict[str, Any]:
+        return self.server.recompute_document(doc_name)
+
+    def batch(self, calls: list[dict[str, Any]]) -> list[dict[str, Any]] | dict[str, Any]:
+        return self.server.batch(calls)
+
 
     def reload_document(self, doc_name: str) -> dict[str, Any]:
         return self.server.reload_document(doc_name)
@@ -78,13 +105,45 @@ class FreeCADConnection:
         height: int | None = None,
         focus_object: str | None = None,
     ) -> str | None:
+        args = (view_name, width, height, focus_object)
         try:
-            return self.server.get_active_screenshot(view_name, width, height, focus_object)
+            if self._binary_screenshots:
+                try:
+                    return _screenshot_text(self.server.get_active_screenshot_bytes(*args))
+                except xmlrpc.client.Fault as e:
+                    if not _method_unsupported(e, "get_active_screenshot_bytes"):
+                        raise
+                    # Older addon without the raw-bytes endpoint.
+                    self._binary_screenshots = False
+            screenshot = self.server.get_active_screenshot(*args)
         except Exception as e:
             logger.error(f"Error getting screenshot: {e}")
             return None
+        return _screenshot_text(screenshot)
+
+    def screenshot_for(self, res: dict[str, Any]) -> str | None:
+        """Return the screenshot bundled into a mutation response.
+
+        Falls back to a separate get_active_screenshot call when the addon
+        did not bundle one (older addons ignore the "Screenshot" flag).
+        """
+        if "screenshot" in res:
+            return _screenshot_text(res["screenshot"])
+        return self.get_active_screenshot()
 
     def get_objects(self, doc_name: str) -> list[dict[str, Any]]:
+        if self._binary_objects:
+            try:
+                res = self.server.get_objects_binary(doc_name)
+            except xmlrpc.client.Fault as e:
+                if not _method_unsupported(e, "get_objects_binary"):
+                    raise
+                # Older addon without the compact endpoint.
+                self._binary_objects = False
+            else:
+                if isinstance(res, xmlrpc.client.Binary):
+                    return json.loads(res.data)
+                return res
         return self.server.get_objects(doc_name)
 
     def get_object(self, doc_name: str, obj_name: str) -> dict[str, Any]:
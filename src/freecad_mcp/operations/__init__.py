@@ -1,8 +1,11 @@
 from .core import (
     create_document_operation,
     create_object_operation,
+    create_objects_operation,
     delete_object_operation,
+    delete_objects_operation,
     edit_object_operation,
+    edit_objects_operation,
     execute_code_async_operation,
     execute_code_operation,
     get_object_operation,
@@ -11,6 +14,7 @@ from .core import (
     get_view_operation,
     insert_part_from_library_operation,
     list_documents_operation,
+    recompute_document_operation,
     reload_document_operation,
     run_fem_analysis_operation,
 )
@@ -18,8 +22,11 @@ from .core import (
 __all__ = [
     "create_document_operation",
     "create_object_operation",
+    "create_objects_operation",
     "delete_object_operation",
+    "delete_objects_operation",
     "edit_object_operation",
+    "edit_objects_operation",
     "execute_code_async_operation",
     "execute_code_operation",
     "get_object_operation",
@@ -28,6 +35,7 @@ __all__ = [
     "get_view_operation",
     "insert_part_from_library_operation",
     "list_documents_operation",
+    "recompute_document_operation",
     "reload_document_operation",
     "run_fem_analysis_operation",
 ]
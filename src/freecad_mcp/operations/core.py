@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from mcp.types import ImageContent
@@ -29,6 +30,7 @@ def create_object_operation(
     obj_name: str,
     analysis_name: str | None = None,
     obj_properties: dict[str, Any] | None = None,
+    defer_recompute: bool = False,
 ) -> ToolResponse:
     try:
         obj_data = {
@@ -37,12 +39,18 @@ def create_object_operation(
             "Properties": obj_properties or {},
             "Analysis": analysis_name,
         }
+        # Without a recompute the view is stale, so skip the screenshot.
+        want_screenshot = not (only_text_feedback or defer_recompute)
+        if defer_recompute:
+            obj_data["DeferRecompute"] = True
+        if want_screenshot:
+            obj_data["Screenshot"] = True
         res = freecad.create_object(doc_name, obj_data)
         if res["success"]:
             response = text_response(f"Object '{res['object_name']}' created successfully")
         else:
             return text_response(f"Failed to create object: {res['error']}")
-        screenshot = None if only_text_feedback else freecad.get_active_screenshot()
+        screenshot = freecad.screenshot_for(res) if want_screenshot else None
         return add_screenshot_if_available(response, screenshot, only_text_feedback)
     except Exception as e:
         logger.error(f"Failed to create object: {str(e)}")
@@ -55,14 +63,24 @@ def edit_object_operation(
     doc_name: str,
     obj_name: str,
     obj_properties: dict[str, Any],
+    defer_recompute: bool = False,
 ) -> ToolResponse:
+    if not obj_properties:
+        # Nothing to set: skip the round trip and the recompute it would cause.
+        return text_response(f"No changes requested for object '{obj_name}'")
     try:
-        res = freecad.edit_object(doc_name, obj_name, {"Properties": obj_properties})
+        want_screenshot = not (only_text_feedback or defer_recompute)
+        obj_data = {"Properties": obj_properties}
+        if defer_recompute:
+            obj_data["DeferRecompute"] = True
+        if want_screenshot:
+            obj_data["Screenshot"] = True
+        res = freecad.edit_object(doc_name, obj_name, obj_data)
         if res["success"]:
             response = text_response(f"Object '{res['object_name']}' edited successfully")
         else:
             return text_response(f"Failed to edit object: {res['error']}")
-        screenshot = None if only_text_feedback else freecad.get_active_screenshot()
+        screenshot = freecad.screenshot_for(res) if want_screenshot else None
         return add_screenshot_if_available(response, screenshot, only_text_feedback)
     except Exception as e:
         logger.error(f"Failed to edit object: {str(e)}")
@@ -74,20 +92,126 @@ def delete_object_operation(
     only_text_feedback: bool,
     doc_name: str,
     obj_name: str,
+    defer_recompute: bool = False,
 ) -> ToolResponse:
     try:
-        res = freecad.delete_object(doc_name, obj_name)
+        res = freecad.delete_object(doc_name, obj_name, defer_recompute)
         if res["success"]:
             response = text_response(f"Object '{res['object_name']}' deleted successfully")
         else:
             return text_response(f"Failed to delete object: {res['error']}")
-        screenshot = None if only_text_feedback else freecad.get_active_screenshot()
+        screenshot = None if only_text_feedback or defer_recompute else freecad.get_active_screenshot()
         return add_screenshot_if_available(response, screenshot, only_text_feedback)
     except Exception as e:
         logger.error(f"Failed to delete object: {str(e)}")
         return text_response(f"Failed to delete object: {str(e)}")
 
 
+def _batch_operation(
+    freecad: FreeCADConnection,
+    only_text_feedback: bool,
+    method: str,
+    verb: str,
+    past: str,
+    doc_name: str,
+    items: list[Any],
+    to_call: Callable[[Any], tuple[str, list[Any]]],
+) -> ToolResponse:
+    """Send one ``method`` call per item in a single ``batch`` RPC.
+
+    ``to_call`` maps an item to ``(obj_name, params after doc_name)``; the
+    reply has one line per object, plus a screenshot of the result.
+    """
+    try:
+        names, calls = [], []
+        for item in items:
+            name, params = to_call(item)
+            names.append(name)
+            calls.append({"method": method, "params": [doc_name, *params]})
+        res = freecad.batch(calls)
+        if isinstance(res, dict):  # the whole batch failed (e.g. GUI timeout)
+            raise RuntimeError(res.get("error", "unknown error"))
+        lines = []
+        for name, entry in zip(names, res):
+            if entry.get("success"):
+                lines.append(f"Object '{name}' {past} successfully")
+            else:
+                lines.append(f"Failed to {verb} object '{name}': {entry.get('error')}")
+        response = text_response("\n".join(lines))
+        screenshot = None if only_text_feedback else freecad.get_active_screenshot()
+        return add_screenshot_if_available(response, screenshot, only_text_feedback)
+    except Exception as e:
+        logger.error(f"Failed to {verb} objects: {str(e)}")
+        return text_response(f"Failed to {verb} objects: {str(e)}")
+
+
+def create_objects_operation(
+    freecad: FreeCADConnection,
+    only_text_feedback: bool,
+    doc_name: str,
+    objects: list[dict[str, Any]],
+) -> ToolResponse:
+    def to_call(obj: dict[str, Any]) -> tuple[str, list[Any]]:
+        return obj["obj_name"], [{
+            "Name": obj["obj_name"],
+            "Type": obj["obj_type"],
+            "Properties": obj.get("obj_properties") or {},
+            "Analysis": obj.get("analysis_name"),
+        }]
+
+    return _batch_operation(
+        freecad, only_text_feedback, "create_object", "create", "created",
+        doc_name, objects, to_call,
+    )
+
+
+def edit_objects_operation(
+    freecad: FreeCADConnection,
+    only_text_feedback: bool,
+    doc_name: str,
+    edits: list[dict[str, Any]],
+) -> ToolResponse:
+    def to_call(edit: dict[str, Any]) -> tuple[str, list[Any]]:
+        return edit["obj_name"], [
+            edit["obj_name"], {"Properties": edit.get("obj_properties") or {}}
+        ]
+
+    return _batch_operation(
+        freecad, only_text_feedback, "edit_object", "edit", "edited",
+        doc_name, edits, to_call,
+    )
+
+
+def delete_objects_operation(
+    freecad: FreeCADConnection,
+    only_text_feedback: bool,
+    doc_name: str,
+    obj_names: list[str],
+) -> ToolResponse:
+    return _batch_operation(
+        freecad, only_text_feedback, "delete_object", "delete", "deleted",
+        doc_name, obj_names, lambda obj_name: (obj_name, [obj_name]),
+    )
+
+
+def recompute_document_operation(
+    freecad: FreeCADConnection,
+    only_text_feedback: bool,
+    doc_name: str,
+) -> ToolResponse:
+    try:
+        res = freecad.recompute_document(doc_name)
+        if res["success"]:
+            response = text_response(f"Document '{res['document_name']}' recomputed successfully")
+        else:
+            return text_response(f"Failed to recompute document: {res['error']}")
+        screenshot = None if only_text_feedback else freecad.get_active_screenshot()
+        return add_screenshot_if_available(response, screenshot, only_text_feedback)
+    except Exception as e:
+        logger.error(f"Failed to recompute document: {str(e)}")
+        return text_response(f"Failed to recompute document: {str(e)}")
+
+
 def execute_code_operation(
     freecad: FreeCADConnection,
     only_text_feedback: bool,
@@ -96,7 +220,10 @@ def execute_code_operation(
     try:
         res = freecad.execute_code(code)
         if res["success"]:
-            response = text_response(f"Code executed successfully: {res['message']}")
+            message = res["message"]
+            if "result" in res:
+                message += f"\nResult: {res['result']}"
+            response = text_response(f"Code executed successfully: {message}")
             # Only attempt screenshot when code completed and screenshots are wanted.
             # Skipping on failure avoids a second hanging call while the worker thread
             # may still be running.
@@ -164,7 +291,8 @@ def get_objects_operation(
     doc_name: str,
 ) -> ToolResponse:
     try:
-        response = json_response(freecad.get_objects(doc_name))
+        # Whole-document dumps get large; indenting them mostly adds whitespace.
+        response = json_response(freecad.get_objects(doc_name), pretty=False)
         screenshot = None if only_text_feedback else freecad.get_active_screenshot()
         return add_screenshot_if_available(response, screenshot, only_text_feedback)
     except Exception as e:
@@ -194,7 +322,8 @@ def get_parts_list_operation(freecad: FreeCADConnection) -> ToolResponse:
         logger.error(f"Failed to get parts list: {str(e)}")
         return text_response(f"Failed to get parts list: {str(e)}")
     if parts:
-        return json_response(parts)
+        # Libraries list thousands of paths; one per indented line doubles the text.
+        return json_response(parts, pretty=False)
     return text_response("No parts found in the parts library. You must add parts_library addon.")
 
 
@@ -9,8 +9,13 @@ def text_response(message: str) -> ToolResponse:
     return [TextContent(type="text", text=message)]
 
 
-def json_response(data: object) -> ToolResponse:
-    return text_response(json.dumps(data, ensure_ascii=False, indent=2, default=str))
+def json_response(data: object, pretty: bool = True) -> ToolResponse:
+    if pretty:
+        return text_response(json.dumps(data, ensure_ascii=False, indent=2, default=str))
+    # Compact form for large payloads: no indentation or padding whitespace.
+    return text_response(
+        json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+    )
 
 
 def add_screenshot_if_available(
@@ -9,8 +9,11 @@ from .freecad_client import FreeCADConnection
 from .operations import (
     create_document_operation,
     create_object_operation,
+    create_objects_operation,
     delete_object_operation,
+    delete_objects_operation,
     edit_object_operation,
+    edit_objects_operation,
     execute_code_async_operation,
     execute_code_operation,
     get_object_operation,
@@ -19,6 +22,7 @@ from .operations import (
     get_view_operation,
     insert_part_from_library_operation,
     list_documents_operation,
+    recompute_document_operation,
     reload_document_operation,
     run_fem_analysis_operation,
 )
@@ -105,6 +109,7 @@ def create_object(
     obj_name: str,
     analysis_name: str | None = None,
     obj_properties: dict[str, Any] = None,
+    defer_recompute: bool = False,
 ) -> list[TextContent | ImageContent]:
     """Create a new object in FreeCAD.
     Object type is starts with "Part::" or "Draft::" or "PartDesign::" or "Fem::".
@@ -114,6 +119,8 @@ def create_object(
         obj_type: The type of the object to create (e.g. 'Part::Box', 'Part::Cylinder', 'Draft::Circle', 'PartDesign::Body', etc.).
         obj_name: The name of the object to create.
         obj_properties: The properties of the object to create.
+        defer_recompute: Skip the document recompute (and the screenshot) after this change.
+            Use when making several changes in a row, then call `recompute_document` once.
 
     Returns:
         A message indicating the success or failure of the object creation and a screenshot of the object.
@@ -230,12 +237,17 @@ def create_object(
         obj_name,
         analysis_name,
         obj_properties,
+        defer_recompute,
     )
 
 
 @mcp.tool()
 def edit_object(
-    ctx: Context, doc_name: str, obj_name: str, obj_properties: dict[str, Any]
+    ctx: Context,
+    doc_name: str,
+    obj_name: str,
+    obj_properties: dict[str, Any],
+    defer_recompute: bool = False,
 ) -> list[TextContent | ImageContent]:
     """Edit an object in FreeCAD.
     This tool is used when the `create_object` tool cannot handle the object creation.
@@ -244,6 +256,8 @@ def edit_object(
         doc_name: The name of the document to edit the object in.
         obj_name: The name of the object to edit.
         obj_properties: The properties of the object to edit.
+        defer_recompute: Skip the document recompute (and the screenshot) after this change.
+            Use when making several changes in a row, then call `recompute_document` once.
 
     Returns:
         A message indicating the success or failure of the object editing and a screenshot of the object.
@@ -254,16 +268,21 @@ def edit_object(
         doc_name,
         obj_name,
         obj_properties,
+        defer_recompute,
     )
 
 
 @mcp.tool()
-def delete_object(ctx: Context, doc_name: str, obj_name: str) -> list[TextContent | ImageContent]:
+def delete_object(
+    ctx: Context, doc_name: str, obj_name: str, defer_recompute: bool = False
+) -> list[TextContent | ImageContent]:
     """Delete an object in FreeCAD.
 
     Args:
         doc_name: The name of the document to delete the object from.
         obj_name: The name of the object to delete.
+        defer_recompute: Skip the document recompute (and the screenshot) after this change.
+            Use when making several changes in a row, then call `recompute_document` once.
 
     Returns:
         A message indicating the success or failure of the object deletion and a screenshot of the object.
@@ -273,6 +292,96 @@ def delete_object(ctx: Context, doc_name: str, obj_name: str) -> list[TextConten
         state.only_text_feedback,
         doc_name,
         obj_name,
+        defer_recompute,
+    )
+
+
+@mcp.tool()
+def create_objects(
+    ctx: Context, doc_name: str, objects: list[dict[str, Any]]
+) -> list[TextContent | ImageContent]:
+    """Create several objects in FreeCAD in one call.
+    Faster than calling `create_object` repeatedly: all objects are created
+    together and the document is recomputed once.
+
+    Args:
+        doc_name: The name of the document to create the objects in.
+        objects: A list of `{"obj_name": ..., "obj_type": ..., "obj_properties": {...},
+            "analysis_name": ...}` entries, in the same format as the `create_object`
+            arguments. `obj_properties` and `analysis_name` are optional.
+
+    Returns:
+        One result line per object and a screenshot of the document.
+    """
+    return create_objects_operation(
+        get_freecad_connection(),
+        state.only_text_feedback,
+        doc_name,
+        objects,
+    )
+
+
+@mcp.tool()
+def edit_objects(
+    ctx: Context, doc_name: str, edits: list[dict[str, Any]]
+) -> list[TextContent | ImageContent]:
+    """Edit several objects in FreeCAD in one call.
+    Faster than calling `edit_object` repeatedly: all edits run together and
+    the document is recomputed once.
+
+    Args:
+        doc_name: The name of the document to edit the objects in.
+        edits: A list of `{"obj_name": ..., "obj_properties": {...}}` entries,
+            with `obj_properties` in the same format as for `edit_object`.
+
+    Returns:
+        One result line per object and a screenshot of the document.
+    """
+    return edit_objects_operation(
+        get_freecad_connection(),
+        state.only_text_feedback,
+        doc_name,
+        edits,
+    )
+
+
+@mcp.tool()
+def delete_objects(
+    ctx: Context, doc_name: str, obj_names: list[str]
+) -> list[TextContent | ImageContent]:
+    """Delete several objects in FreeCAD in one call.
+    The document is recomputed once after all deletions.
+
+    Args:
+        doc_name: The name of the document to delete the objects from.
+        obj_names: The names of the objects to delete.
+
+    Returns:
+        One result line per object and a screenshot of the document.
+    """
+    return delete_objects_operation(
+        get_freecad_connection(),
+        state.only_text_feedback,
+        doc_name,
+        obj_names,
+    )
+
+
+@mcp.tool()
+def recompute_document(ctx: Context, doc_name: str) -> list[TextContent | ImageContent]:
+    """Recompute a document in FreeCAD.
+    Call this once after a series of changes made with `defer_recompute=True`.
+
+    Args:
+        doc_name: The name of the document to recompute.
+
+    Returns:
+        A message indicating the success or failure of the recompute and a screenshot of the document.
+    """
+    return recompute_document_operation(
+        get_freecad_connection(),
+        state.only_text_feedback,
+        doc_name,
     )
 
 
@@ -318,6 +427,12 @@ def execute_code_async(ctx: Context, code: str) -> list[TextContent]:
 @mcp.tool()
 def execute_code(ctx: Context, code: str) -> list[TextContent | ImageContent]:
     """Execute arbitrary Python code in FreeCAD.
+    To return structured data, assign it to `__result__` instead of printing it;
+    it is sent back as JSON.
+    The code runs in its own namespace, kept between calls, with `FreeCAD`/`App`,
+    `FreeCADGui`/`Gui`, `QtCore`, `base64`, `contextlib`, `io`, `json`, `os`,
+    `struct`, `tempfile`, `threading` and `traceback` available; the addon's
+    internal helpers are not, so import anything else you need.
 
     Args:
         code: The Python code to execute.
@@ -378,34 +493,44 @@ def insert_part_from_library(ctx: Context, relative_path: str) -> list[TextConte
 
 
 @mcp.tool()
-def get_objects(ctx: Context, doc_name: str) -> list[TextContent | ImageContent]:
+def get_objects(
+    ctx: Context, doc_name: str, include_screenshot: bool = False
+) -> list[TextContent | ImageContent]:
     """Get all objects in a document.
     You can use this tool to get the objects in a document to see what you can check or edit.
 
     Args:
         doc_name: The name of the document to get the objects from.
+        include_screenshot: Also return a screenshot of the document (use `get_view` for a specific view).
 
     Returns:
-        A list of objects in the document and a screenshot of the document.
+        A list of objects in the document, and a screenshot of the document if requested.
     """
-    return get_objects_operation(get_freecad_connection(), state.only_text_feedback, doc_name)
+    return get_objects_operation(
+        get_freecad_connection(),
+        state.only_text_feedback or not include_screenshot,
+        doc_name,
+    )
 
 
 @mcp.tool()
-def get_object(ctx: Context, doc_name: str, obj_name: str) -> list[TextContent | ImageContent]:
+def get_object(
+    ctx: Context, doc_name: str, obj_name: str, include_screenshot: bool = False
+) -> list[TextContent | ImageContent]:
     """Get an object from a document.
     You can use this tool to get the properties of an object to see what you can check or edit.
 
     Args:
         doc_name: The name of the document to get the object from.
         obj_name: The name of the object to get.
+        include_screenshot: Also return a screenshot of the object (use `get_view` for a specific view).
 
     Returns:
-        The object and a screenshot of the object.
+        The object, and a screenshot of the object if requested.
     """
     return get_object_operation(
         get_freecad_connection(),
-        state.only_text_feedback,
+        state.only_text_feedback or not include_screenshot,
         doc_name,
         obj_name,
     )